@@ -1,6 +1,49 @@
 from __future__ import absolute_import
-from .ops import *
-from .plots import *
+import importlib
+import sys
 
 __all__ = ['ops',
-           'plots']
\ No newline at end of file
+           'plots']
+
+# public names re-exported at the package level, mapped to the submodule that defines them. the submodules (and the
+# heavy dependencies they pull in) are only imported the first time one of these names is accessed.
+_LAZY_ATTRS = {'buildings_sanfran'        : 'ops',
+               'dsm_sanfran'              : 'ops',
+               'reproject'                : 'ops',
+               'buffer_meters'            : 'ops',
+               'calc_stats'               : 'ops',
+               'calc_object_heights'      : 'ops',
+               'write_geojson'            : 'ops',
+               'labels_to_polygons'       : 'ops',
+               'read_from_raster'         : 'ops',
+               'create_hillshade'         : 'ops',
+               'segment_trees'            : 'ops',
+               'from_geojson'             : 'ops',
+               'TMS_104001002E6A7E00'     : 'plots',
+               'COLORS'                   : 'plots',
+               'TABLE_CSS'                : 'plots',
+               'plot_array'               : 'plots',
+               'footprints_outline_styler': 'plots',
+               'folium_map'               : 'plots',
+               'add_popups'               : 'plots',
+               'folium_map_tooltips'      : 'plots',
+               'to_geojson'               : 'plots',
+               'np_serializer'            : 'plots',
+               'get_map_style'            : 'plots'}
+
+if sys.version_info < (3, 7):
+    # module-level __getattr__ (PEP 562) is not available, so fall back to eager imports
+    from .ops import *
+    from .plots import *
+else:
+    def __getattr__(name):
+        if name in __all__:
+            return importlib.import_module('.' + name, __name__)
+        if name in _LAZY_ATTRS:
+            value = getattr(importlib.import_module('.' + _LAZY_ATTRS[name], __name__), name)
+            globals()[name] = value
+            return value
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(__all__) | set(_LAZY_ATTRS))
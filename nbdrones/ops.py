@@ -7,12 +7,8 @@ from rasterio import features
 import numpy as np
 import pyproj
 from functools import partial
-from matplotlib.colors import LightSource
-import matplotlib.pyplot as plt
 from shapely import ops
 import json
-from skimage import filters, measure, segmentation
-import requests
 import sys
 
 # CONSTANTS
@@ -122,7 +118,12 @@ def read_from_raster(rast_reader, bounds=None, band=1):
     return rast_reader.read(band, window=window)
 
 
-def create_hillshade(array, cmap=plt.cm.pink, vert_exag=1, azdeg=315, altdeg=45):
+def create_hillshade(array, cmap=None, vert_exag=1, azdeg=315, altdeg=45):
+    # matplotlib is imported here so that non-plotting workflows don't pay for loading it
+    from matplotlib.colors import LightSource
+    import matplotlib.pyplot as plt
+    if cmap is None:
+        cmap = plt.cm.pink
     light_source = LightSource(azdeg=azdeg, altdeg=altdeg)
     hillshade = light_source.shade(array, vmin=0, vmax=array.max() * 1.25, cmap=cmap, vert_exag=vert_exag,
                                    blend_mode='soft')
@@ -131,6 +132,8 @@ def create_hillshade(array, cmap=plt.cm.pink, vert_exag=1, azdeg=315, altdeg=45)
 
 
 def segment_trees(img, n_segments=2000):
+    from skimage import filters, measure, segmentation
+
     # segment the image
     rgb = img.rgb(blm=True)
     rgb_smooth = filters.gaussian(filters.gaussian(rgb, preserve_range=True, multichannel=True),
@@ -153,6 +156,7 @@ def segment_trees(img, n_segments=2000):
 
 def from_geojson(source):
     if source.startswith('http'):
+        import requests
         response = requests.get(source)
         geojson = json.loads(response.content)
     else:
@@ -0,0 +1,26 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ['matplotlib', 'skimage', 'rasterio', 'pyproj', 'folium', 'jinja2', 'pandas', 'requests', 'shapely',
+                 'numpy', 'nbdrones.ops', 'nbdrones.plots']
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='lazy imports require module-level __getattr__ (PEP 562)')
+def test_bare_import_does_not_load_submodules():
+    # run in a fresh interpreter so modules imported by other tests don't leak into sys.modules
+    code = ("import json, sys, nbdrones; "
+            "print(json.dumps([m for m in {!r} if m in sys.modules]))".format(HEAVY_MODULES))
+    loaded = json.loads(subprocess.check_output([sys.executable, '-c', code]).decode())
+
+    assert loaded == []
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='lazy imports require module-level __getattr__ (PEP 562)')
+def test_unknown_attribute_raises():
+    import nbdrones
+
+    with pytest.raises(AttributeError):
+        nbdrones.not_a_function